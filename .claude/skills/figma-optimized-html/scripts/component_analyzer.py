@@ -6,17 +6,38 @@ HTML 파일을 분석하여 Figma 변환 시 발생할 수 있는 중복 요소
 최적화 제안을 생성합니다.
 
 사용법:
-    python component_analyzer.py <html_file>
+    python component_analyzer.py <html_file> [추가파일.html ...]
     python component_analyzer.py liquid-glass.html
 """
 
-import sys
+import heapq
+import io
+import mmap
+import os
 import re
-from collections import Counter, defaultdict
-from pathlib import Path
-from html.parser import HTMLParser
+import sys
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from hashlib import blake2b
+from html.parser import HTMLParser
+
+import report_cache
+
+try:
+    from selectolax.parser import HTMLParser as _LexborHTMLParser
+except ImportError:  # 선택적 C 파서 — 없으면 html.parser 폴백 사용
+    _LexborHTMLParser = None
+
+
+def _normalize_ws(markup: str) -> str:
+    """공백 정규화 — str.split/join은 C에서 동작하므로 정규식보다 빠름"""
+    return " ".join(markup.split())
+
+
+def _svg_key(normalized: str) -> bytes:
+    """전체 SVG 문자열 대신 16바이트 다이제스트를 dict 키로 사용"""
+    return blake2b(normalized.encode("utf-8"), digest_size=16).digest()
 
 
 @dataclass
@@ -36,213 +57,367 @@ class ElementInfo:
     count: int = 1
 
 
+@dataclass
+class AnalysisResult:
+    """파서 경로와 무관하게 generate_report가 읽는 집계 결과"""
+    svg_contents: dict = field(default_factory=dict)
+    elements: list = field(default_factory=list)
+    class_counter: Counter = field(default_factory=Counter)
+    tag_counter: Counter = field(default_factory=Counter)
+    data_components: Counter = field(default_factory=Counter)
+    position_absolute_count: int = 0
+    flexbox_count: int = 0
+    grid_count: int = 0
+
+
 class HTMLAnalyzer(HTMLParser):
-    """HTML 분석 파서"""
+    """HTML 분석 파서 (selectolax 미설치 시 폴백)"""
 
     def __init__(self):
         super().__init__()
-        self.svg_contents: dict[str, SVGInfo] = {}
+        self.svg_contents: dict[bytes, SVGInfo] = {}
         self.elements: list[ElementInfo] = []
         self.class_counter = Counter()
         self.tag_counter = Counter()
         self.data_components = Counter()
-        self.current_svg = []
         self.in_svg = False
         self.svg_depth = 0
-        self.line_number = 1
         self.position_absolute_count = 0
         self.flexbox_count = 0
         self.grid_count = 0
+        # 태그/클래스 이름은 리스트에 모아 두었다가 Counter.update가
+        # C 루프로 한 번에 집계하도록 버퍼링
+        self._pending_tags: list[str] = []
+        self._pending_classes: list[str] = []
+        # SVG 서브트리는 토큰을 다시 조립하지 않고 원본에서 슬라이스
+        # 하기 위해 공급된 소스와 줄 시작 오프셋을 유지
+        self._source: list[str] = []
+        self._fed_len = 0
+        self._line_starts: list[int] = [0]
+        self._svg_start = 0
+        self._svg_line = 0
+
+    def feed(self, data):
+        base = self._fed_len
+        pos = data.find("\n")
+        while pos != -1:
+            self._line_starts.append(base + pos + 1)
+            pos = data.find("\n", pos + 1)
+        self._fed_len += len(data)
+        self._source.append(data)
+        super().feed(data)
+
+    def _offset(self) -> int:
+        lineno, col = self.getpos()
+        return self._line_starts[lineno - 1] + col
+
+    def _source_text(self) -> str:
+        if len(self._source) > 1:
+            self._source = ["".join(self._source)]
+        return self._source[0] if self._source else ""
 
     def handle_starttag(self, tag: str, attrs: list):
-        attrs_dict = dict(attrs)
-
-        # SVG 추적
-        if tag == 'svg':
-            self.in_svg = True
-            self.svg_depth = 1
-            self.current_svg = [f'<{tag}']
-            for name, value in attrs:
-                self.current_svg.append(f' {name}="{value}"')
-            self.current_svg.append('>')
-        elif self.in_svg:
+        # SVG 추적 — 바깥 <svg>의 시작 오프셋만 기록
+        if tag == "svg":
+            if self.svg_depth == 0:
+                self._svg_start = self._offset()
+                self._svg_line = self.getpos()[0]
+                self.in_svg = True
             self.svg_depth += 1
-            self.current_svg.append(f'<{tag}')
-            for name, value in attrs:
-                self.current_svg.append(f' {name}="{value}"')
-            self.current_svg.append('>')
 
         # 태그 카운트
-        self.tag_counter[tag] += 1
-
-        # 클래스 카운트
-        if 'class' in attrs_dict:
-            classes = attrs_dict['class'].split()
-            for cls in classes:
-                self.class_counter[cls] += 1
-
-        # data-component 카운트
-        if 'data-component' in attrs_dict:
-            self.data_components[attrs_dict['data-component']] += 1
-
-        # 스타일 분석
-        style = attrs_dict.get('style', '')
-        if 'position: absolute' in style or 'position:absolute' in style:
+        self._pending_tags.append(tag)
+
+        for name, value in attrs:
+            # 클래스 카운트
+            if name == "class" and value:
+                self._pending_classes.extend(value.split())
+            # data-component 카운트
+            elif name == "data-component" and value:
+                self.data_components[value] += 1
+            # 스타일 분석 (리터럴 검사 — 정규식 불필요)
+            elif name == "style" and value:
+                self._count_style(value)
+
+    def _count_style(self, style: str):
+        if "position: absolute" in style or "position:absolute" in style:
             self.position_absolute_count += 1
-        if 'display: flex' in style or 'display:flex' in style:
+        if "display: flex" in style or "display:flex" in style:
             self.flexbox_count += 1
-        if 'display: grid' in style or 'display:grid' in style:
+        if "display: grid" in style or "display:grid" in style:
             self.grid_count += 1
 
     def handle_endtag(self, tag: str):
-        if self.in_svg:
-            self.current_svg.append(f'</{tag}>')
+        if tag == "svg" and self.svg_depth:
             self.svg_depth -= 1
             if self.svg_depth == 0:
-                svg_content = ''.join(self.current_svg)
-                # 정규화 (공백 제거)
-                normalized = re.sub(r'\s+', ' ', svg_content).strip()
-
-                if normalized in self.svg_contents:
-                    self.svg_contents[normalized].count += 1
-                    self.svg_contents[normalized].locations.append(self.line_number)
+                self.in_svg = False
+                end = self._offset() + len(tag) + 3  # "</" + tag + ">"
+                svg_content = self._source_text()[self._svg_start:end]
+                # 정규화 (공백 제거) 후 다이제스트를 키로 사용
+                key = _svg_key(_normalize_ws(svg_content))
+                if key in self.svg_contents:
+                    self.svg_contents[key].count += 1
+                    self.svg_contents[key].locations.append(self._svg_line)
                 else:
-                    self.svg_contents[normalized] = SVGInfo(
+                    self.svg_contents[key] = SVGInfo(
                         content=svg_content,
                         count=1,
-                        locations=[self.line_number]
+                        locations=[self._svg_line]
                     )
-                self.in_svg = False
-                self.current_svg = []
-
-    def handle_data(self, data: str):
-        if self.in_svg:
-            self.current_svg.append(data)
-        self.line_number += data.count('\n')
-
 
+    def close(self):
+        super().close()
+        self._flush_counts()
+
+    def _flush_counts(self):
+        if self._pending_tags:
+            self.tag_counter.update(self._pending_tags)
+            self._pending_tags = []
+        if self._pending_classes:
+            self.class_counter.update(self._pending_classes)
+            self._pending_classes = []
+
+    def result(self) -> AnalysisResult:
+        self._flush_counts()
+        return AnalysisResult(
+            svg_contents=self.svg_contents,
+            elements=self.elements,
+            class_counter=self.class_counter,
+            tag_counter=self.tag_counter,
+            data_components=self.data_components,
+            position_absolute_count=self.position_absolute_count,
+            flexbox_count=self.flexbox_count,
+            grid_count=self.grid_count,
+        )
+
+
+def analyze(content: str) -> AnalysisResult:
+    """HTML 분석 — selectolax가 있으면 C(lexbor) 파서로 노드를 순회"""
+    if _LexborHTMLParser is None:
+        parser = HTMLAnalyzer()
+        parser.feed(content)
+        parser.close()
+        return parser.result()
+
+    result = AnalysisResult()
+    tags: list[str] = []
+    classes: list[str] = []
+    tree = _LexborHTMLParser(content)
+
+    for node in tree.root.traverse(include_text=False):
+        tag = node.tag
+        if tag.startswith(("_", "-")):  # _comment / -undef 의사 노드 제외
+            continue
+        tags.append(tag)
+        # node.attrs는 C 레벨 희소 뷰 — 노드마다 dict를 만들지 않음
+        attrs = node.attrs
+        class_value = attrs.get("class") or ""
+        if class_value:
+            classes.extend(class_value.split())
+        component = attrs.get("data-component")
+        if component:
+            result.data_components[component] += 1
+        style = attrs.get("style") or ""
+        if style:
+            if "position: absolute" in style or "position:absolute" in style:
+                result.position_absolute_count += 1
+            if "display: flex" in style or "display:flex" in style:
+                result.flexbox_count += 1
+            if "display: grid" in style or "display:grid" in style:
+                result.grid_count += 1
+        if tag == "svg":
+            svg_content = node.html
+            key = _svg_key(_normalize_ws(svg_content))
+            if key in result.svg_contents:
+                result.svg_contents[key].count += 1
+            else:
+                result.svg_contents[key] = SVGInfo(content=svg_content, count=1)
+
+    result.tag_counter = Counter(tags)
+    result.class_counter = Counter(classes)
+    return result
+
+
+def _read_content(filepath: str) -> str:
+    """mmap으로 읽고 한 번만 디코딩 (CSS/패턴 분석에 전체 str 필요)"""
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:].decode("utf-8", "replace")
+
+
+def analyze_file(filepath: str) -> AnalysisResult:
+    """임포트용 진입점: 파일 하나를 분석"""
+    return analyze(_read_content(filepath))
+
+
+_VAR_DEF_RE = re.compile(r"--([a-zA-Z0-9-]+)\s*:\s*([^;]+);")
+
+
+@lru_cache(maxsize=32)
 def analyze_css_variables(content: str) -> dict:
     """CSS 변수 분석"""
-    # :root 블록 찾기
-    root_match = re.search(r':root\s*\{([^}]+)\}', content, re.DOTALL)
-    variables = {}
-
-    if root_match:
-        root_content = root_match.group(1)
-        # CSS 변수 추출
-        var_pattern = r'--([a-zA-Z0-9-]+)\s*:\s*([^;]+);'
-        for match in re.finditer(var_pattern, root_content):
-            variables[f'--{match.group(1)}'] = match.group(2).strip()
-
-    return variables
-
-
+    # :root 블록을 중괄호 균형 스캔으로 추출 — str.find가 괄호 사이를
+    # C 속도로 건너뛰며, 중첩 블록도 잘리지 않음
+    start = content.find(":root")
+    if start == -1:
+        return {}
+    open_brace = content.find("{", start)
+    if open_brace == -1:
+        return {}
+    depth = 1
+    pos = open_brace + 1
+    while depth:
+        next_open = content.find("{", pos)
+        next_close = content.find("}", pos)
+        if next_close == -1:
+            pos = len(content) + 1  # 괄호 불균형 — 나머지 전체 사용
+            break
+        if next_open != -1 and next_open < next_close:
+            depth += 1
+            pos = next_open + 1
+        else:
+            depth -= 1
+            pos = next_close + 1
+    root_content = content[open_brace + 1 : pos - 1]
+
+    # CSS 변수 추출
+    return {
+        f"--{m.group(1)}": m.group(2).strip()
+        for m in _VAR_DEF_RE.finditer(root_content)
+    }
+
+
+# 주의: 기존 패턴처럼 접두사만 본다 (<li는 <line도 매치) — 리포트 호환 유지
+_STRUCTURAL_RE = re.compile(r"<(tr|li|div)")
+
+
+@lru_cache(maxsize=32)
 def analyze_repeated_patterns(content: str) -> list:
     """반복 패턴 분석"""
-    patterns = []
-
-    # 동일한 클래스를 가진 연속 요소 찾기
-    table_rows = len(re.findall(r'<tr[^>]*>', content))
-    list_items = len(re.findall(r'<li[^>]*>', content))
-    div_cards = len(re.findall(r'<div[^>]*class="[^"]*card[^"]*"', content))
+    # 동일한 클래스를 가진 연속 요소 찾기 — 패턴별 전체 스캔 대신
+    # 리터럴 접두사 하나의 alternation으로 한 번만 선형 스캔하고,
+    # div는 매치 직후의 짧은 윈도우로만 card 여부를 확인
+    table_rows = 0
+    list_items = 0
+    div_cards = 0
+    for m in _STRUCTURAL_RE.finditer(content):
+        tag = m.group(1)
+        if tag == "tr":
+            table_rows += 1
+        elif tag == "li":
+            list_items += 1
+        else:
+            window = content[m.end() : m.end() + 200]
+            tag_end = window.find(">")
+            if tag_end != -1:
+                window = window[:tag_end]
+            if "card" in window:
+                div_cards += 1
 
+    patterns = []
     if table_rows > 5:
-        patterns.append(('table rows', table_rows))
+        patterns.append(("table rows", table_rows))
     if list_items > 5:
-        patterns.append(('list items', list_items))
+        patterns.append(("list items", list_items))
     if div_cards > 3:
-        patterns.append(('card components', div_cards))
+        patterns.append(("card components", div_cards))
 
     return patterns
 
 
-def generate_report(analyzer: HTMLAnalyzer, css_vars: dict, patterns: list, filepath: str) -> str:
+def generate_report(analyzer, css_vars: dict, patterns: list, filepath: str) -> str:
     """분석 리포트 생성"""
-    report = []
-    report.append("=" * 60)
-    report.append(f"Figma 최적화 분석 리포트: {filepath}")
-    report.append("=" * 60)
-    report.append("")
+    buf = io.StringIO()
+    write = buf.write
+    write("=" * 60 + "\n")
+    write(f"Figma 최적화 분석 리포트: {filepath}\n")
+    write("=" * 60 + "\n")
+    write("\n")
 
     # 1. 중복 SVG 분석
-    report.append("## 1. 중복 SVG 분석")
-    report.append("-" * 40)
+    write("## 1. 중복 SVG 분석\n")
+    write("-" * 40 + "\n")
 
     duplicate_svgs = [(k, v) for k, v in analyzer.svg_contents.items() if v.count > 1]
     if duplicate_svgs:
-        report.append(f"⚠️  중복된 SVG: {len(duplicate_svgs)}개 발견")
-        report.append("")
-        for svg_hash, info in sorted(duplicate_svgs, key=lambda x: -x[1].count):
-            report.append(f"  - {info.count}번 반복")
+        write(f"⚠️  중복된 SVG: {len(duplicate_svgs)}개 발견\n")
+        write("\n")
+        for svg_hash, info in heapq.nlargest(
+            len(duplicate_svgs), duplicate_svgs, key=lambda x: x[1].count
+        ):
+            write(f"  - {info.count}번 반복\n")
             preview = info.content[:80] + "..." if len(info.content) > 80 else info.content
-            report.append(f"    미리보기: {preview}")
-            report.append("")
-        report.append("  💡 해결: SVG 심볼 시스템 사용 (<symbol> + <use>)")
+            write(f"    미리보기: {preview}\n")
+            write("\n")
+        write("  💡 해결: SVG 심볼 시스템 사용 (<symbol> + <use>)\n")
     else:
-        report.append("✅ 중복 SVG 없음")
-    report.append("")
+        write("✅ 중복 SVG 없음\n")
+    write("\n")
 
     # 2. 반복 패턴 분석
-    report.append("## 2. 반복 패턴 분석")
-    report.append("-" * 40)
+    write("## 2. 반복 패턴 분석\n")
+    write("-" * 40 + "\n")
 
     if patterns:
         for pattern_name, count in patterns:
-            report.append(f"  - {pattern_name}: {count}개")
-        report.append("")
-        report.append("  💡 해결: <template> 기반 렌더링 또는 data-component 속성 사용")
+            write(f"  - {pattern_name}: {count}개\n")
+        write("\n")
+        write("  💡 해결: <template> 기반 렌더링 또는 data-component 속성 사용\n")
     else:
-        report.append("✅ 과도한 반복 패턴 없음")
-    report.append("")
+        write("✅ 과도한 반복 패턴 없음\n")
+    write("\n")
 
     # 3. data-component 사용 현황
-    report.append("## 3. data-component 사용 현황")
-    report.append("-" * 40)
+    write("## 3. data-component 사용 현황\n")
+    write("-" * 40 + "\n")
 
     if analyzer.data_components:
-        report.append("✅ data-component 속성 사용 중:")
+        write("✅ data-component 속성 사용 중:\n")
         for comp, count in analyzer.data_components.most_common(10):
-            report.append(f"  - {comp}: {count}개")
+            write(f"  - {comp}: {count}개\n")
     else:
-        report.append("⚠️  data-component 속성 없음")
-        report.append("  💡 반복 요소에 data-component 속성 추가 권장")
-    report.append("")
+        write("⚠️  data-component 속성 없음\n")
+        write("  💡 반복 요소에 data-component 속성 추가 권장\n")
+    write("\n")
 
     # 4. 레이아웃 방식 분석
-    report.append("## 4. 레이아웃 방식 분석")
-    report.append("-" * 40)
+    write("## 4. 레이아웃 방식 분석\n")
+    write("-" * 40 + "\n")
 
-    report.append(f"  - Flexbox 사용: {analyzer.flexbox_count}개")
-    report.append(f"  - Grid 사용: {analyzer.grid_count}개")
-    report.append(f"  - Position absolute: {analyzer.position_absolute_count}개")
+    write(f"  - Flexbox 사용: {analyzer.flexbox_count}개\n")
+    write(f"  - Grid 사용: {analyzer.grid_count}개\n")
+    write(f"  - Position absolute: {analyzer.position_absolute_count}개\n")
 
     if analyzer.position_absolute_count > 5:
-        report.append("")
-        report.append("  ⚠️  position: absolute 과다 사용")
-        report.append("  💡 Flexbox/Grid로 변환 권장 (Auto Layout 호환성)")
-    report.append("")
+        write("\n")
+        write("  ⚠️  position: absolute 과다 사용\n")
+        write("  💡 Flexbox/Grid로 변환 권장 (Auto Layout 호환성)\n")
+    write("\n")
 
     # 5. CSS 변수 분석
-    report.append("## 5. CSS 변수 분석")
-    report.append("-" * 40)
+    write("## 5. CSS 변수 분석\n")
+    write("-" * 40 + "\n")
 
     if css_vars:
         color_vars = [v for v in css_vars if 'color' in v.lower() or v.startswith('--bg') or v.startswith('--text')]
         space_vars = [v for v in css_vars if 'space' in v.lower() or 'gap' in v.lower() or 'padding' in v.lower()]
         font_vars = [v for v in css_vars if 'font' in v.lower()]
 
-        report.append(f"✅ CSS 변수 정의됨: {len(css_vars)}개")
-        report.append(f"  - 색상 관련: {len(color_vars)}개")
-        report.append(f"  - 간격 관련: {len(space_vars)}개")
-        report.append(f"  - 폰트 관련: {len(font_vars)}개")
+        write(f"✅ CSS 변수 정의됨: {len(css_vars)}개\n")
+        write(f"  - 색상 관련: {len(color_vars)}개\n")
+        write(f"  - 간격 관련: {len(space_vars)}개\n")
+        write(f"  - 폰트 관련: {len(font_vars)}개\n")
     else:
-        report.append("⚠️  :root에 CSS 변수 없음")
-        report.append("  💡 Design Tokens을 CSS 변수로 정의 권장")
-    report.append("")
+        write("⚠️  :root에 CSS 변수 없음\n")
+        write("  💡 Design Tokens을 CSS 변수로 정의 권장\n")
+    write("\n")
 
     # 6. 최적화 점수
-    report.append("## 6. Figma 최적화 점수")
-    report.append("-" * 40)
+    write("## 6. Figma 최적화 점수\n")
+    write("-" * 40 + "\n")
 
     score = 100
     issues = []
@@ -269,39 +444,53 @@ def generate_report(analyzer: HTMLAnalyzer, css_vars: dict, patterns: list, file
         score -= 10
         issues.append("CSS 변수 미사용 (-10점)")
 
-    report.append(f"  점수: {score}/100")
+    write(f"  점수: {score}/100\n")
     if issues:
-        report.append("  감점 항목:")
+        write("  감점 항목:\n")
         for issue in issues:
-            report.append(f"    - {issue}")
-    report.append("")
+            write(f"    - {issue}\n")
+    write("\n")
 
     # 7. 권장 사항
-    report.append("## 7. 권장 사항")
-    report.append("-" * 40)
+    write("## 7. 권장 사항\n")
+    write("-" * 40 + "\n")
 
     if score >= 80:
-        report.append("✅ Figma 변환 준비 완료!")
+        write("✅ Figma 변환 준비 완료!\n")
     elif score >= 60:
-        report.append("⚠️  일부 최적화 필요")
+        write("⚠️  일부 최적화 필요\n")
     else:
-        report.append("❌ 상당한 최적화 필요")
+        write("❌ 상당한 최적화 필요\n")
 
-    report.append("")
-    report.append("권장 조치:")
+    write("\n")
+    write("권장 조치:\n")
     if duplicate_svgs:
-        report.append("  1. SVG 심볼 시스템 적용")
+        write("  1. SVG 심볼 시스템 적용\n")
     if analyzer.position_absolute_count > 5:
-        report.append("  2. Flexbox/Grid 레이아웃으로 변환")
+        write("  2. Flexbox/Grid 레이아웃으로 변환\n")
     if not analyzer.data_components:
-        report.append("  3. 반복 요소에 data-component 속성 추가")
+        write("  3. 반복 요소에 data-component 속성 추가\n")
     if not css_vars:
-        report.append("  4. Design Tokens을 CSS 변수로 정의")
+        write("  4. Design Tokens을 CSS 변수로 정의\n")
+
+    write("\n")
+    write("=" * 60)
 
-    report.append("")
-    report.append("=" * 60)
+    return buf.getvalue()
 
-    return "\n".join(report)
+
+def report_for(filepath: str) -> str:
+    """임포트용 진입점: 파일 하나에 대한 렌더링된 리포트 (캐시 사용)"""
+    cached = report_cache.load(filepath, "analyzer")
+    if cached is not None:
+        return cached[0]
+    content = _read_content(filepath)
+    result = analyze(content)
+    css_vars = analyze_css_variables(content)
+    patterns = analyze_repeated_patterns(content)
+    report = generate_report(result, css_vars, patterns, filepath)
+    report_cache.store(filepath, "analyzer", report)
+    return report
 
 
 def main():
@@ -310,28 +499,20 @@ def main():
         print("예시: python component_analyzer.py liquid-glass.html")
         sys.exit(1)
 
-    filepath = sys.argv[1]
-    path = Path(filepath)
-
-    if not path.exists():
-        print(f"오류: 파일을 찾을 수 없습니다: {filepath}")
-        sys.exit(1)
-
-    content = path.read_text(encoding='utf-8')
-
-    # HTML 분석
-    analyzer = HTMLAnalyzer()
-    analyzer.feed(content)
-
-    # CSS 변수 분석
-    css_vars = analyze_css_variables(content)
-
-    # 반복 패턴 분석
-    patterns = analyze_repeated_patterns(content)
-
-    # 리포트 생성
-    report = generate_report(analyzer, css_vars, patterns, filepath)
-    print(report)
+    status = 0
+    for i, filepath in enumerate(sys.argv[1:]):
+        if i:
+            print()
+        # 존재 여부를 미리 검사하지 않고 읽기 실패를 그대로 처리 (TOCTOU 없음)
+        try:
+            print(report_for(filepath))
+        except FileNotFoundError:
+            print(f"오류: 파일을 찾을 수 없습니다: {filepath}")
+            status = 1
+        except OSError as exc:
+            print(f"오류: 파일을 읽을 수 없습니다: {filepath} ({exc.strerror})")
+            status = 1
+    sys.exit(status)
 
 
 if __name__ == "__main__":
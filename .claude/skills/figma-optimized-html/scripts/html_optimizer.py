@@ -6,17 +6,31 @@ HTML 파일이 Figma 변환 최적화 규칙을 따르는지 검증하고
 개선 사항을 제안합니다.
 
 사용법:
-    python html_optimizer.py <html_file>
-    python html_optimizer.py liquid-glass.html --fix  # 자동 수정 제안 포함
+    python html_optimizer.py <html_file> [추가파일.html ...]
+    python html_optimizer.py liquid-glass.html
+    python html_optimizer.py liquid-glass.html --json
 """
 
-import sys
-import re
+import argparse
+import io
 import json
-from pathlib import Path
+import mmap
+import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
 from enum import Enum
+from hashlib import blake2b
+from typing import Optional
+
+import report_cache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택적 직렬화기
+    orjson = None
 
 
 class Severity(Enum):
@@ -35,109 +49,237 @@ class Issue:
     suggestion: Optional[str] = None
 
 
+# 패턴은 모듈 임포트 시 한 번만 컴파일
+_SVG_RE = re.compile(r"<svg[^>]*>.*?</svg>", re.DOTALL)
+_STYLE_BLOCK_RE = re.compile(r"<style[^>]*>(.*?)</style>", re.DOTALL)
+_INLINE_STYLE_RE = re.compile(r'style="([^"]*)"')
+_CLASS_RE = re.compile(r'class="([^"]*)"')
+_VAR_NAME_RE = re.compile(r"--[a-zA-Z0-9-]+\s*:")
+_CATEGORY_PATTERNS = {
+    "color": re.compile(r"--color-|--bg-|--text-"),
+    "space": re.compile(r"--space-|--gap-|--padding-"),
+    "font": re.compile(r"--font-"),
+    "radius": re.compile(r"--radius-"),
+}
+# \b 단어 경계라서 is-active 같은 하이픈 결합 형태도 잡힘
+_STATE_WORD_RE = re.compile(r"\b(active|disabled|hover|focus|selected)\b")
+_DYNAMIC_CONTAINER_RE = re.compile(r'<(tbody|ul|div)[^>]*id="[^"]*"[^>]*>\s*</\1>')
+# 기존 패턴 그대로 대소문자 무시 전체 일치 — google-re2가 설치되어
+# 있으면 DFA로 컴파일되어 백트래킹 없이 선형 시간이 보장됨
+_BEM_PATTERN = r"[a-z][a-z0-9]*(__[a-z][a-z0-9]*)?(-{1,2}[a-z][a-z0-9]*)?"
+try:
+    import re2 as _re2
+
+    _BEM_RE = _re2.compile(_BEM_PATTERN, _re2.IGNORECASE)
+except ImportError:  # pragma: no cover - 선택적 엔진
+    _BEM_RE = re.compile(_BEM_PATTERN, re.IGNORECASE)
+# 레이아웃 패턴은 스타일 블롭을 한 번만 지나며 함께 카운트.
+# 기본은 이름 있는 그룹을 가진 단일 alternation, python-hyperscan이
+# 설치되어 있으면 같은 패턴을 하나의 DFA로 컴파일해 스트리밍 스캔
+_GROUP_PATTERNS = (
+    ("abs", r"position\s*:\s*absolute"),
+    ("flex", r"display\s*:\s*flex"),
+    ("grid", r"display\s*:\s*grid"),
+)
+_LAYOUT_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in _GROUP_PATTERNS),
+    re.IGNORECASE,
+)
+
+try:
+    import hyperscan as _hyperscan
+except ImportError:  # pragma: no cover - 선택적 엔진
+    _hyperscan = None
+
+_HS_DB = None
+if _hyperscan is not None:
+    try:
+        _HS_DB = _hyperscan.Database()
+        _HS_DB.compile(
+            expressions=[pattern.encode() for _, pattern in _GROUP_PATTERNS],
+            ids=list(range(len(_GROUP_PATTERNS))),
+            flags=[_hyperscan.HS_FLAG_CASELESS] * len(_GROUP_PATTERNS),
+        )
+    except _hyperscan.error:
+        _HS_DB = None
+
+
+def _scan_counts(styles: str) -> Counter:
+    """_GROUP_PATTERNS 전체를 *styles* 위에서 한 번의 선형 스캔으로 카운트
+
+    주의: CSS가 포함된 텍스트(스타일 블록 + 인라인 스타일)만 넘길 것 —
+    문서 전체를 스캔하면 <script> 문자열 속 선언까지 집계됩니다.
+    """
+    counts: Counter = Counter()
+    if _HS_DB is not None:
+        def on_match(pattern_id, start, end, flags, context):
+            counts[_GROUP_PATTERNS[pattern_id][0]] += 1
+
+        _HS_DB.scan(styles.encode("utf-8", "replace"), match_event_handler=on_match)
+        return counts
+    for m in _LAYOUT_RE.finditer(styles):
+        counts[m.lastgroup] += 1
+    return counts
+# 반복 요소는 리터럴 접두사 alternation 한 번으로 선형 스캔하고,
+# 태그 내부 윈도우만 잘라 class/card/btn 여부를 확인
+_STRUCTURAL_RE = re.compile(r"<(tr|li|div|button)\b")
+
+
+def _root_block(content: str) -> Optional[str]:
+    """중괄호 균형 스캔으로 :root 블록 내용 추출
+
+    str.find가 괄호 사이를 C 속도로 건너뛰므로 DOTALL 정규식과 달리
+    중첩 블록에도 안전하고 백트래킹이 없습니다.
+    """
+    start = content.find(":root")
+    if start == -1:
+        return None
+    open_brace = content.find("{", start)
+    if open_brace == -1:
+        return None
+    depth = 1
+    pos = open_brace + 1
+    while depth:
+        next_open = content.find("{", pos)
+        next_close = content.find("}", pos)
+        if next_close == -1:
+            pos = len(content) + 1  # 괄호 불균형 — 나머지 전체 사용
+            break
+        if next_open != -1 and next_open < next_close:
+            depth += 1
+            pos = next_open + 1
+        else:
+            depth -= 1
+            pos = next_close + 1
+    return content[open_brace + 1 : pos - 1]
+
+
 class HTMLOptimizer:
     """HTML 최적화 검증기"""
 
     def __init__(self, content: str):
         self.content = content
-        self.lines = content.split('\n')
+        # 여러 규칙이 공유하는 뷰는 한 번만 추출
+        self._inline_styles = _INLINE_STYLE_RE.findall(content)
+        self._style_blob = (
+            "\n".join(_STYLE_BLOCK_RE.findall(content))
+            + "\n".join(self._inline_styles)
+        )
+        self._class_values = _CLASS_RE.findall(content)
+        self._unique_classes = {
+            cls for value in self._class_values for cls in value.split()
+        }
         self.issues: list[Issue] = []
 
     def check_all(self) -> list[Issue]:
         """모든 검증 규칙 실행"""
-        self.check_svg_symbols()
-        self.check_data_components()
-        self.check_css_variables()
-        self.check_layout_methods()
-        self.check_theme_support()
-        self.check_state_attributes()
-        self.check_template_usage()
-        self.check_class_naming()
-        return self.issues
-
-    def check_svg_symbols(self):
+        checks = (
+            self.check_svg_symbols,
+            self.check_data_components,
+            self.check_css_variables,
+            self.check_layout_methods,
+            self.check_theme_support,
+            self.check_state_attributes,
+            self.check_template_usage,
+            self.check_class_naming,
+        )
+        # re는 GIL을 잡은 채 실행되므로 스레드 풀은 오버헤드만 추가함
+        issues: list[Issue] = []
+        for check in checks:
+            issues.extend(check())
+        self.issues = issues
+        return issues
+
+    def check_svg_symbols(self) -> list[Issue]:
         """SVG 심볼 사용 검증"""
-        # SVG 태그 찾기
-        svg_pattern = r'<svg[^>]*>.*?</svg>'
-        svgs = re.findall(svg_pattern, self.content, re.DOTALL)
-
-        # 심볼 정의 확인
-        has_symbol_defs = '<symbol' in self.content
-        uses_href = 'href="#' in self.content or "xlink:href" in self.content
-
-        # 동일한 SVG 찾기
-        svg_hashes = {}
-        for svg in svgs:
-            normalized = re.sub(r'\s+', ' ', svg).strip()
-            if '<symbol' not in normalized:  # 심볼 정의는 제외
-                if normalized in svg_hashes:
-                    svg_hashes[normalized] += 1
-                else:
-                    svg_hashes[normalized] = 1
+        issues: list[Issue] = []
+        has_symbol_defs = "<symbol" in self.content
+
+        # <svg>가 2개 미만이면 중복이 있을 수 없음 — 비싼 정규화 생략
+        if self.content.count("<svg") < 2:
+            return issues
+
+        # 동일한 SVG 찾기 — 정규화 문자열 대신 16바이트 다이제스트를 키로
+        svg_hashes: Counter = Counter()
+        for m in _SVG_RE.finditer(self.content):
+            segment = m.group(0)
+            if "<symbol" in segment:  # 심볼 정의는 제외
+                continue
+            normalized = " ".join(segment.split())
+            svg_hashes[blake2b(normalized.encode("utf-8"), digest_size=16).digest()] += 1
 
         duplicates = {k: v for k, v in svg_hashes.items() if v > 1}
 
         if duplicates and not has_symbol_defs:
-            self.issues.append(Issue(
+            issues.append(Issue(
                 severity=Severity.ERROR,
                 rule="svg-symbols",
                 message=f"동일한 SVG가 {len(duplicates)}종류 반복됨 (총 {sum(duplicates.values())}개)",
                 suggestion="SVG 심볼 시스템 사용: <symbol id='icon-name'> + <use href='#icon-name'/>"
             ))
         elif duplicates and has_symbol_defs:
-            self.issues.append(Issue(
+            issues.append(Issue(
                 severity=Severity.WARNING,
                 rule="svg-symbols",
                 message="심볼 정의가 있지만 일부 SVG가 직접 인라인됨",
                 suggestion="모든 반복 SVG를 <use> 참조로 변경"
             ))
+        return issues
 
-    def check_data_components(self):
+    def check_data_components(self) -> list[Issue]:
         """data-component 속성 검증"""
-        has_data_component = 'data-component=' in self.content
+        issues: list[Issue] = []
+        has_data_component = "data-component=" in self.content
+
+        # 반복 가능한 요소 찾기 — 패턴별 전체 스캔 대신 한 번의 선형 스캔
+        counts: Counter = Counter()
+        for m in _STRUCTURAL_RE.finditer(self.content):
+            tag = m.group(1)
+            window = self.content[m.end() : m.end() + 200]
+            tag_end = window.find(">")
+            if tag_end != -1:
+                window = window[:tag_end]
+            if "class" not in window:
+                continue
+            if tag == "div" and "card" not in window:
+                continue
+            if tag == "button" and "btn" not in window:
+                continue
+            counts[tag] += 1
 
-        # 반복 가능한 요소 찾기
         repeated_elements = []
-        for pattern, name in [
-            (r'<tr[^>]*class', 'table rows'),
-            (r'<li[^>]*class', 'list items'),
-            (r'<div[^>]*class="[^"]*card', 'cards'),
-            (r'<button[^>]*class="[^"]*btn', 'buttons'),
-        ]:
-            count = len(re.findall(pattern, self.content))
-            if count > 3:
-                repeated_elements.append((name, count))
+        for tag, name in (("tr", "table rows"), ("li", "list items"),
+                          ("div", "cards"), ("button", "buttons")):
+            if counts[tag] > 3:
+                repeated_elements.append((name, counts[tag]))
 
         if repeated_elements and not has_data_component:
-            self.issues.append(Issue(
+            issues.append(Issue(
                 severity=Severity.WARNING,
                 rule="data-component",
                 message=f"반복 요소 발견: {', '.join([f'{n}({c}개)' for n, c in repeated_elements])}",
                 suggestion="반복 요소에 data-component 속성 추가: data-component='card'"
             ))
+        return issues
 
-    def check_css_variables(self):
+    def check_css_variables(self) -> list[Issue]:
         """CSS 변수 사용 검증"""
-        # :root 블록 확인
-        has_root = ':root' in self.content
-
-        if not has_root:
-            self.issues.append(Issue(
+        issues: list[Issue] = []
+        if ":root" not in self.content:
+            issues.append(Issue(
                 severity=Severity.ERROR,
                 rule="css-variables",
                 message="CSS 변수가 :root에 정의되지 않음",
                 suggestion=":root { --color-primary: #3b82f6; --space-md: 16px; ... }"
             ))
-            return
+            return issues
 
-        # 변수 정의 확인
-        root_match = re.search(r':root\s*\{([^}]+)\}', self.content, re.DOTALL)
-        if root_match:
-            root_content = root_match.group(1)
-            var_count = len(re.findall(r'--[a-zA-Z0-9-]+\s*:', root_content))
+        root_content = _root_block(self.content)
+        if root_content is not None:
+            var_count = len(_VAR_NAME_RE.findall(root_content))
 
             if var_count < 5:
-                self.issues.append(Issue(
+                issues.append(Issue(
                     severity=Severity.WARNING,
                     rule="css-variables",
                     message=f"CSS 변수가 부족함 ({var_count}개)",
@@ -145,47 +287,34 @@ class HTMLOptimizer:
                 ))
 
             # 카테고리별 변수 확인
-            categories = {
-                'color': r'--color-|--bg-|--text-',
-                'space': r'--space-|--gap-|--padding-',
-                'font': r'--font-',
-                'radius': r'--radius-',
-            }
-
-            for category, pattern in categories.items():
-                if not re.search(pattern, root_content):
-                    self.issues.append(Issue(
+            for category, pattern in _CATEGORY_PATTERNS.items():
+                if not pattern.search(root_content):
+                    issues.append(Issue(
                         severity=Severity.INFO,
                         rule="css-variables",
                         message=f"{category} 관련 CSS 변수 없음",
                         suggestion=f"--{category}-* 변수 정의 권장"
                     ))
+        return issues
 
-    def check_layout_methods(self):
+    def check_layout_methods(self) -> list[Issue]:
         """레이아웃 방식 검증"""
-        # 스타일 태그 내용 추출
-        style_content = ""
-        style_matches = re.findall(r'<style[^>]*>(.*?)</style>', self.content, re.DOTALL)
-        style_content = '\n'.join(style_matches)
-
-        # 인라인 스타일도 확인
-        inline_styles = re.findall(r'style="([^"]*)"', self.content)
-        all_styles = style_content + '\n'.join(inline_styles)
-
-        # position: absolute 카운트
-        absolute_count = len(re.findall(r'position\s*:\s*absolute', all_styles, re.IGNORECASE))
-        flexbox_count = len(re.findall(r'display\s*:\s*flex', all_styles, re.IGNORECASE))
-        grid_count = len(re.findall(r'display\s*:\s*grid', all_styles, re.IGNORECASE))
+        issues: list[Issue] = []
+        # position: absolute / flex / grid를 한 번의 스캔으로 카운트
+        counts = _scan_counts(self._style_blob)
+        absolute_count = counts["abs"]
+        flexbox_count = counts["flex"]
+        grid_count = counts["grid"]
 
         if absolute_count > 10:
-            self.issues.append(Issue(
+            issues.append(Issue(
                 severity=Severity.ERROR,
                 rule="layout",
                 message=f"position: absolute 과다 사용 ({absolute_count}개)",
                 suggestion="Flexbox/Grid로 변환하여 Auto Layout 호환성 확보"
             ))
         elif absolute_count > 5:
-            self.issues.append(Issue(
+            issues.append(Issue(
                 severity=Severity.WARNING,
                 rule="layout",
                 message=f"position: absolute 사용 ({absolute_count}개)",
@@ -193,152 +322,152 @@ class HTMLOptimizer:
             ))
 
         if flexbox_count + grid_count == 0:
-            self.issues.append(Issue(
+            issues.append(Issue(
                 severity=Severity.WARNING,
                 rule="layout",
                 message="Flexbox/Grid 레이아웃 미사용",
                 suggestion="Figma Auto Layout 호환을 위해 Flexbox/Grid 사용 권장"
             ))
+        return issues
 
-    def check_theme_support(self):
+    def check_theme_support(self) -> list[Issue]:
         """테마 지원 검증"""
-        has_theme_attr = 'data-theme=' in self.content
-        has_theme_selector = '[data-theme=' in self.content
-
-        if not has_theme_attr:
-            self.issues.append(Issue(
+        issues: list[Issue] = []
+        if "data-theme=" not in self.content:
+            issues.append(Issue(
                 severity=Severity.INFO,
                 rule="theme",
                 message="테마 속성 없음",
                 suggestion="<html data-theme='dark'> 형태로 테마 지원 추가"
             ))
 
-        if not has_theme_selector:
-            self.issues.append(Issue(
+        if "[data-theme=" not in self.content:
+            issues.append(Issue(
                 severity=Severity.INFO,
                 rule="theme",
                 message="테마 선택자 없음",
                 suggestion="[data-theme='dark'] { ... } 형태로 테마별 스타일 정의"
             ))
+        return issues
 
-    def check_state_attributes(self):
+    def check_state_attributes(self) -> list[Issue]:
         """상태 속성 검증"""
-        # 상태 클래스 사용 확인
-        state_classes = re.findall(r'class="[^"]*\b(active|disabled|hover|focus|selected)\b[^"]*"', self.content)
+        issues: list[Issue] = []
+        # 상태 클래스 사용 확인 — 이미 추출해 둔 class 값만 스캔
+        state_classes = _STATE_WORD_RE.findall(" ".join(self._class_values))
 
         # data-state 사용 확인
-        data_states = re.findall(r'data-state="([^"]*)"', self.content)
+        has_data_state = 'data-state="' in self.content
 
-        if state_classes and not data_states:
-            self.issues.append(Issue(
+        if state_classes and not has_data_state:
+            issues.append(Issue(
                 severity=Severity.WARNING,
                 rule="state-attributes",
                 message=f"상태 클래스 사용됨: {', '.join(set(state_classes))}",
                 suggestion="data-state 속성으로 변경 권장: data-state='active'"
             ))
+        return issues
 
-    def check_template_usage(self):
+    def check_template_usage(self) -> list[Issue]:
         """템플릿 사용 검증"""
-        has_template = '<template' in self.content
+        issues: list[Issue] = []
+        has_template = "<template" in self.content
 
         # 동적 렌더링 영역 확인 (JavaScript로 채워지는 컨테이너)
-        dynamic_containers = re.findall(r'<(tbody|ul|div)[^>]*id="[^"]*"[^>]*>\s*</\1>', self.content)
+        dynamic_containers = _DYNAMIC_CONTAINER_RE.findall(self.content)
 
         if dynamic_containers and not has_template:
-            self.issues.append(Issue(
+            issues.append(Issue(
                 severity=Severity.INFO,
                 rule="template",
                 message="동적 컨테이너가 있지만 <template> 미사용",
                 suggestion="<template id='item-template'>로 컴포넌트 구조 정의 권장"
             ))
+        return issues
 
-    def check_class_naming(self):
+    def check_class_naming(self) -> list[Issue]:
         """클래스 명명 규칙 검증"""
-        # 모든 클래스 추출
-        classes = re.findall(r'class="([^"]*)"', self.content)
-        all_classes = []
-        for cls_str in classes:
-            all_classes.extend(cls_str.split())
-
+        issues: list[Issue] = []
         # BEM 패턴 확인
-        bem_pattern = r'^[a-z][a-z0-9]*(__[a-z][a-z0-9]*)?(-{1,2}[a-z][a-z0-9]*)?$'
-        non_bem_classes = [c for c in set(all_classes)
-                          if not re.match(bem_pattern, c, re.IGNORECASE)
-                          and not c.startswith('js-')]
+        non_bem_classes = [c for c in self._unique_classes
+                           if not _BEM_RE.fullmatch(c)
+                           and not c.startswith('js-')]
 
-        if len(non_bem_classes) > len(set(all_classes)) * 0.5:
-            self.issues.append(Issue(
+        if len(non_bem_classes) > len(self._unique_classes) * 0.5:
+            issues.append(Issue(
                 severity=Severity.INFO,
                 rule="class-naming",
                 message="BEM 명명 규칙 미준수 클래스 다수",
                 suggestion="block__element--modifier 형태의 명명 규칙 권장"
             ))
+        return issues
 
 
 def generate_report(issues: list[Issue], filepath: str) -> str:
     """검증 리포트 생성"""
-    report = []
-    report.append("=" * 60)
-    report.append(f"HTML 최적화 검증 리포트: {filepath}")
-    report.append("=" * 60)
-    report.append("")
+    buf = io.StringIO()
+    write = buf.write
+    write("=" * 60 + "\n")
+    write(f"HTML 최적화 검증 리포트: {filepath}\n")
+    write("=" * 60 + "\n")
+    write("\n")
 
     errors = [i for i in issues if i.severity == Severity.ERROR]
     warnings = [i for i in issues if i.severity == Severity.WARNING]
     infos = [i for i in issues if i.severity == Severity.INFO]
 
-    report.append(f"총 이슈: {len(issues)}개")
-    report.append(f"  - 오류: {len(errors)}개")
-    report.append(f"  - 경고: {len(warnings)}개")
-    report.append(f"  - 정보: {len(infos)}개")
-    report.append("")
+    write(f"총 이슈: {len(issues)}개\n")
+    write(f"  - 오류: {len(errors)}개\n")
+    write(f"  - 경고: {len(warnings)}개\n")
+    write(f"  - 정보: {len(infos)}개\n")
+    write("\n")
 
     if errors:
-        report.append("## 오류 (필수 수정)")
-        report.append("-" * 40)
+        write("## 오류 (필수 수정)\n")
+        write("-" * 40 + "\n")
         for issue in errors:
-            report.append(f"❌ [{issue.rule}] {issue.message}")
+            write(f"❌ [{issue.rule}] {issue.message}\n")
             if issue.suggestion:
-                report.append(f"   💡 {issue.suggestion}")
-            report.append("")
+                write(f"   💡 {issue.suggestion}\n")
+            write("\n")
 
     if warnings:
-        report.append("## 경고 (권장 수정)")
-        report.append("-" * 40)
+        write("## 경고 (권장 수정)\n")
+        write("-" * 40 + "\n")
         for issue in warnings:
-            report.append(f"⚠️  [{issue.rule}] {issue.message}")
+            write(f"⚠️  [{issue.rule}] {issue.message}\n")
             if issue.suggestion:
-                report.append(f"   💡 {issue.suggestion}")
-            report.append("")
+                write(f"   💡 {issue.suggestion}\n")
+            write("\n")
 
     if infos:
-        report.append("## 정보 (선택 개선)")
-        report.append("-" * 40)
+        write("## 정보 (선택 개선)\n")
+        write("-" * 40 + "\n")
         for issue in infos:
-            report.append(f"ℹ️  [{issue.rule}] {issue.message}")
+            write(f"ℹ️  [{issue.rule}] {issue.message}\n")
             if issue.suggestion:
-                report.append(f"   💡 {issue.suggestion}")
-            report.append("")
+                write(f"   💡 {issue.suggestion}\n")
+            write("\n")
 
     # 결과 요약
-    report.append("## 결과")
-    report.append("-" * 40)
+    write("## 결과\n")
+    write("-" * 40 + "\n")
     if not errors and not warnings:
-        report.append("✅ Figma 변환 준비 완료!")
+        write("✅ Figma 변환 준비 완료!\n")
     elif not errors:
-        report.append("⚠️  경고 사항 확인 후 변환 가능")
+        write("⚠️  경고 사항 확인 후 변환 가능\n")
     else:
-        report.append("❌ 오류 수정 필요")
+        write("❌ 오류 수정 필요\n")
 
-    report.append("")
-    report.append("=" * 60)
+    write("\n")
+    write("=" * 60)
 
-    return "\n".join(report)
+    return buf.getvalue()
 
 
 def generate_json_report(issues: list[Issue], filepath: str) -> str:
     """JSON 형식 리포트 생성"""
-    return json.dumps({
+    data = {
         "file": filepath,
         "issues": [
             {
@@ -355,39 +484,76 @@ def generate_json_report(issues: list[Issue], filepath: str) -> str:
             "warnings": len([i for i in issues if i.severity == Severity.WARNING]),
             "infos": len([i for i in issues if i.severity == Severity.INFO]),
         }
-    }, indent=2, ensure_ascii=False)
-
-
-def main():
-    if len(sys.argv) < 2:
-        print("사용법: python html_optimizer.py <html_file> [--json]")
-        print("예시: python html_optimizer.py liquid-glass.html")
-        print("      python html_optimizer.py liquid-glass.html --json")
-        sys.exit(1)
-
-    filepath = sys.argv[1]
-    json_output = '--json' in sys.argv
-
-    path = Path(filepath)
-    if not path.exists():
-        print(f"오류: 파일을 찾을 수 없습니다: {filepath}")
-        sys.exit(1)
-
-    content = path.read_text(encoding='utf-8')
-
-    optimizer = HTMLOptimizer(content)
-    issues = optimizer.check_all()
-
+    }
+    if orjson is not None:
+        # orjson은 C 직렬화기 — UTF-8 비이스케이프 출력이 기본이라
+        # ensure_ascii=False와 동일한 결과를 냄
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _read_content(filepath: str) -> str:
+    """mmap으로 읽고 한 번만 디코딩 (검증 규칙은 전체 str 필요)"""
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:].decode("utf-8", "replace")
+
+
+def optimize_file(filepath: str) -> list[Issue]:
+    """임포트용 진입점: 모든 검증 규칙 실행
+
+    여러 파일을 검사할 때는 프로세스를 파일마다 띄우지 말고 이 함수를
+    임포트해 호출 — 인터프리터 기동과 패턴 컴파일 비용이 한 번으로 줄어듦
+    """
+    return HTMLOptimizer(_read_content(filepath)).check_all()
+
+
+def _process(filepath: str, json_output: bool) -> tuple[str, int]:
+    if not json_output:
+        cached = report_cache.load(filepath, "optimizer")
+        if cached is not None:
+            return cached
+
+    # 존재 여부를 미리 검사하지 않고 읽기 실패를 그대로 처리 (TOCTOU 없음)
+    try:
+        issues = optimize_file(filepath)
+    except FileNotFoundError:
+        return f"오류: 파일을 찾을 수 없습니다: {filepath}", 1
+    except OSError as exc:
+        return f"오류: 파일을 읽을 수 없습니다: {filepath} ({exc.strerror})", 1
+
+    # 오류가 있으면 exit code 1 — 이슈 목록에서 직접 판정
+    status = 1 if any(i.severity == Severity.ERROR for i in issues) else 0
     if json_output:
-        print(generate_json_report(issues, filepath))
+        return generate_json_report(issues, filepath), status
+    report = generate_report(issues, filepath)
+    report_cache.store(filepath, "optimizer", report, status)
+    return report, status
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="HTML 파일이 Figma 변환 최적화 규칙을 따르는지 검증합니다."
+    )
+    parser.add_argument("paths", nargs="+", help="검증할 HTML 파일")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    parser.add_argument("--jobs", type=int, default=1, help="파일을 병렬로 처리")
+    args = parser.parse_args(argv)
+
+    if args.jobs > 1 and len(args.paths) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            results = list(executor.map(_process, args.paths, [args.json] * len(args.paths)))
     else:
-        print(generate_report(issues, filepath))
+        results = [_process(filepath, args.json) for filepath in args.paths]
 
-    # 오류가 있으면 exit code 1
-    errors = [i for i in issues if i.severity == Severity.ERROR]
-    if errors:
-        sys.exit(1)
+    status = 0
+    for output, code in results:
+        print(output)
+        status = max(status, code)
+    return status
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
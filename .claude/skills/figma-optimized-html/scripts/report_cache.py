@@ -0,0 +1,55 @@
+"""리포트 디스크 캐시
+
+pre-commit 훅이나 watch 루프는 변경되지 않은 파일에 대해 CLI를 반복
+실행하므로, 렌더링된 리포트를 ~/.cache/figma-optimizer/ 아래에
+(경로, mtime_ns, 크기) 키로 저장해 재사용합니다. 파일이 수정되면 키가
+바뀌므로 오래된 항목이 반환될 수 없습니다. 캐시는 best-effort이며
+I/O 오류 시 일반 실행으로 대체됩니다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from hashlib import blake2b
+from pathlib import Path
+
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "figma-optimizer"
+
+
+def _key(path: str) -> str | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    raw = f"{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+    return blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load(path: str, kind: str) -> tuple[str, int] | None:
+    """캐시된 (리포트, exit code)를 반환, 미스일 경우 None"""
+    key = _key(path)
+    if key is None:
+        return None
+    try:
+        with open(_CACHE_DIR / f"{kind}-{key}.json", encoding="utf-8") as f:
+            entry = json.load(f)
+            return entry["report"], entry.get("status", 0)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def store(path: str, kind: str, report: str, status: int = 0) -> None:
+    key = _key(path)
+    if key is None:
+        return
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_CACHE_DIR / f"{kind}-{key}.json", "w", encoding="utf-8") as f:
+            json.dump(
+                {"path": os.path.abspath(path), "report": report, "status": status},
+                f,
+                ensure_ascii=False,
+            )
+    except OSError:
+        pass